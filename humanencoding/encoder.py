@@ -20,8 +20,9 @@
 
 
 import importlib
-from binascii import crc32, hexlify
-from struct import pack, unpack
+from functools import lru_cache
+from struct import pack, unpack_from
+from zlib import crc32
 
 
 DEFAULT_WORDLIST_VERSION = 1
@@ -32,12 +33,6 @@ DEFAULT_MAX_ENCODING_BYTES = 10240
 DEFAULT_MAX_DECODING_WORDS = 1024
 
 
-try:
-    text_type = unicode
-except NameError:
-    text_type = str
-
-
 class HumanEncodingError(Exception):
 
     pass
@@ -49,13 +44,11 @@ class ChecksumError(HumanEncodingError):
 
 
 wordlist = []
+word_index_map = {}
 
 
-def lazily_load_wordlist(version=DEFAULT_WORDLIST_VERSION):
-    global wordlist
-    if wordlist:
-        return
-    version = int(version)
+@lru_cache(maxsize=None)
+def _load_wordlist(version):
     wordlist_module_name = '.wordlist_v{}'.format(version)
     try:
         wordlist_module = importlib.import_module(wordlist_module_name,
@@ -63,38 +56,27 @@ def lazily_load_wordlist(version=DEFAULT_WORDLIST_VERSION):
     except Exception as e:
         err = 'Invalid word list module: {} ({})'
         raise HumanEncodingError(err.format(wordlist_module_name, e))
-    wordlist = getattr(wordlist_module, 'words', None)
-    if not wordlist:
+    words = getattr(wordlist_module, 'words', None)
+    if not words:
         raise HumanEncodingError('Word list module has no words attribute')
-    elif len(wordlist) != WORDLIST_SIZE:
+    elif len(words) != WORDLIST_SIZE:
         err = 'Word list is in invalid size, found {} and expected {} words'
         raise HumanEncodingError(err.format(len(words), WORDLIST_SIZE))
+    return words, dict(zip(words, range(WORDLIST_SIZE)))
 
 
-def _bytes_to_int(b):
-    return unpack('<H', b)[0]
-
-
-def _chunk_to_word(chunk):
-    global wordlist
-    try:
-        return wordlist[_bytes_to_int(chunk)]
-    except IndexError:
-        err = 'Invalid chunk, is the wordlist the correct size?'
-        raise HumanEncodingError(err.format(word))
-
-
-def _int_to_bytes(i):
-    return pack('<H', i)
+def lazily_load_wordlist(version=DEFAULT_WORDLIST_VERSION):
+    global wordlist, word_index_map
+    wordlist, word_index_map = _load_wordlist(int(version))
+    return wordlist, word_index_map
 
 
-def _word_to_chunk(word):
-    global wordlist
+def _words_to_ints(words, word_index_map):
     try:
-        return _int_to_bytes(wordlist.index(word))
-    except ValueError:
+        return list(map(word_index_map.__getitem__, words))
+    except KeyError as e:
         err = 'Invalid word: {} (word not in wordlist)'
-        raise HumanEncodingError(err.format(word))
+        raise HumanEncodingError(err.format(e.args[0]))
 
 
 def _crc32(data):
@@ -103,47 +85,44 @@ def _crc32(data):
 
 def encode(binary_data, version=DEFAULT_WORDLIST_VERSION, checksum=False,
            return_string=True, max_bytes=DEFAULT_MAX_ENCODING_BYTES):
-    global wordlist
     if not isinstance(binary_data, (bytes, bytearray)):
         err = 'Data must be in bytes, convert it first. Got: {}'
         raise HumanEncodingError(err.format(type(binary_data)))
     if len(binary_data) > max_bytes:
         err = 'Data is too big, allowed byte size: {} bytes, got: {} bytes'
         raise HumanEncodingError(err.format(len(binary_data), max_bytes))
-    lazily_load_wordlist(version=version)
+    wordlist, _ = _load_wordlist(int(version))
     data_len = len(binary_data)
     padded = data_len % 2 == 1
+    indexes = unpack_from('<{}H'.format(data_len // 2), binary_data)
+    encoded_output = list(map(wordlist.__getitem__, indexes))
     if padded:
-        binary_data += b'\0'
-        data_len += 1
-    encoded_output = []
-    for i in range(0, data_len, 2):
-        chunk = binary_data[i: i + 2]
-        encoded_output.append(_chunk_to_word(chunk))
-    if padded:
+        # the high byte of the padded chunk is zero, so the index is just
+        # the last byte
+        encoded_output.append(wordlist[binary_data[-1]])
         encoded_output.append(PADDING_WORD)
     if checksum:
         encoded_output.append(CHECKSUM_WORD)
-        checksum_int = _crc32(binary_data[:-1] if padded else binary_data)
-        checksum_bytes = pack('<I', checksum_int)
-        encoded_output.append(_chunk_to_word(checksum_bytes[0:2]))
-        encoded_output.append(_chunk_to_word(checksum_bytes[2:4]))
+        checksum_int = _crc32(binary_data)
+        encoded_output.append(wordlist[checksum_int & 0xffff])
+        encoded_output.append(wordlist[checksum_int >> 16])
     return ' '.join(encoded_output) if return_string else encoded_output
 
 
 def decode(words, version=DEFAULT_WORDLIST_VERSION,
            max_words=DEFAULT_MAX_DECODING_WORDS):
-    global wordlist
-    lazily_load_wordlist(version=version)
-    if isinstance(words, (str, text_type)):
-        words = words.split()
-    if not isinstance(words, (list, tuple)):
+    _, word_index_map = _load_wordlist(int(version))
+    is_string = isinstance(words, str)
+    if is_string:
+        words = words.lower().split()
+    elif not isinstance(words, (list, tuple)):
         err = 'Words must be a string, list or tuple. Got: {}'
         raise HumanEncodingError(err.format(type(words)))
     if len(words) > max_words:
         err = 'Words are too big, allowed number of words: {}, got: {}'
         raise HumanEncodingError(err.format(len(words), max_words))
-    words = [str(w).lower() for w in words]
+    if not is_string:
+        words = [(w if isinstance(w, str) else str(w)).lower() for w in words]
     checksum_words = []
     if len(words) > 3 and words[-3] == CHECKSUM_WORD:
         checksum_words = words[-2:]
@@ -153,15 +132,13 @@ def decode(words, version=DEFAULT_WORDLIST_VERSION,
         words = words[:-1]
     else:
         is_padded = False
-    output = b''
-    for word in words:
-        output += _word_to_chunk(word)
+    indexes = _words_to_ints(words, word_index_map)
+    output = pack('<{}H'.format(len(indexes)), *indexes)
     if is_padded:
         output = output[:-1]
     if checksum_words:
-        checksum_packed = _word_to_chunk(checksum_words[0])
-        checksum_packed += _word_to_chunk(checksum_words[1])
-        checksum_unpacked = unpack('<I', checksum_packed)[0]
-        if checksum_unpacked != _crc32(output):
+        low, high = _words_to_ints(checksum_words, word_index_map)
+        checksum_int = low | (high << 16)
+        if checksum_int != _crc32(output):
             raise HumanEncodingError('Invalid CRC32 checksum')
     return output
@@ -13,6 +13,7 @@ setup(
     license='LGPLv3',
     include_package_data=True,
     packages=find_packages(),
+    python_requires='>=3.3',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -20,8 +21,6 @@ setup(
             'or later (LGPLv3+)',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.3',
         'Programming Language :: Python :: 3.4',
@@ -10,8 +10,13 @@ class TestEncoder(unittest.TestCase):
         self.assertEqual(len(humanencoding.encoder.wordlist),
                          65536)
 
+    def test_wordlist_cached(self):
+        first = humanencoding.encoder.lazily_load_wordlist()
+        second = humanencoding.encoder.lazily_load_wordlist(version='1')
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+
     def test_invalid_wordlist_version(self):
-        humanencoding.encoder.wordlist = []
         try:
             humanencoding.encoder.lazily_load_wordlist(version=0)
             raised_invalid_wordlist_error = False
@@ -49,6 +54,13 @@ class TestEncoder(unittest.TestCase):
         self.assertEqual(humanencoding.encode(test_input),
                          expected_output)
 
+    def test_encode_padding_bytearray(self):
+        test_input = bytearray(b'testa')
+        expected_output = 'hatsful journeyings ableist null'
+        self.assertEqual(humanencoding.encode(test_input),
+                         expected_output)
+        self.assertEqual(test_input, bytearray(b'testa'))
+
     def test_decode_padding(self):
         test_input = 'hatsful journeyings ableist null'
         expected_output = b'testa'
@@ -67,6 +79,18 @@ class TestEncoder(unittest.TestCase):
         self.assertEqual(humanencoding.decode(test_input),
                          expected_output)
 
+    def test_encode_padding_checksum(self):
+        test_input = b'testa'
+        expected_output = 'hatsful journeyings ableist null check molly teen'
+        self.assertEqual(humanencoding.encode(test_input, checksum=True),
+                         expected_output)
+
+    def test_decode_padding_checksum(self):
+        test_input = 'hatsful journeyings ableist null check molly teen'
+        expected_output = b'testa'
+        self.assertEqual(humanencoding.decode(test_input),
+                         expected_output)
+
     def test_invalid_checksum(self):
         test_input = 'test journeyings check lighteners stocking'
         try:
@@ -96,6 +120,24 @@ class TestEncoder(unittest.TestCase):
             raised_max_size_error = True
         self.assertTrue(raised_max_size_error)
 
+    def test_decode_max_size_before_conversion(self):
+        converted = []
+
+        class Word(object):
+
+            def __str__(self):
+                converted.append(self)
+                return 'hatsful'
+
+        test_input = [Word() for _ in range(5)]
+        try:
+            humanencoding.decode(test_input, max_words=4)
+            raised_max_size_error = False
+        except humanencoding.HumanEncodingError:
+            raised_max_size_error = True
+        self.assertTrue(raised_max_size_error)
+        self.assertEqual(converted, [])
+
     def test_full_encode_decode(self):
         test_input = os.urandom(128)
         encoded_data = humanencoding.encode(test_input, checksum=True)
@@ -0,0 +1,25 @@
+'''
+    Reads a list file (one entry per line) as used by the wordlist scripts.
+    Blank lines and lines starting with a # are skipped. Leading and trailing
+    whitespace is stripped from each entry.
+'''
+
+
+import os
+import mmap
+import re
+
+
+# matches each line that is not blank or a comment, treating \n, \r\n and a
+# bare \r as line breaks like a text mode file does
+_line_regex = re.compile(rb'(?:^|(?<=[\r\n]))[^\S\r\n]*([^#\s][^\r\n]*)')
+
+
+def read_file(filename):
+    if not os.path.getsize(filename):
+        return []
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = _line_regex.findall(mm)
+    lines = (line.decode('utf-8').strip() for line in lines)
+    return [line for line in lines if line and not line.startswith('#')]
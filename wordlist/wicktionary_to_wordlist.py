@@ -29,12 +29,13 @@ import lxml.etree
 import string
 import re
 import argparse
+from listfile import read_file
 
 
 MIN_WORD_LEN = 3
 MAX_WORD_LEN = 12
 MIN_BADWORD_FRAGMENT_LEN = 4
-VOWELS = ('a', 'e', 'i', 'o', 'u', 'y')
+VOWELS = frozenset('aeiouy')
 
 
 _wiki_markdown_regex = re.compile('{{([^}]+)}}')
@@ -52,24 +53,8 @@ def is_digit(char):
 
 
 def is_lowercase_word(word):
-    has_vowel = False
-    for char in word:
-        if char not in string.ascii_lowercase:
-            return False
-        if char in VOWELS:
-            has_vowel = True
-    return has_vowel
-
-
-def read_file(filename):
-    r = []
-    with open(filename, 'rt') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            r.append(line)
-    return r
+    return (word.isascii() and word.isalpha() and word.islower() and
+            not VOWELS.isdisjoint(word))
 
 
 def clean_word(word):
@@ -142,17 +127,23 @@ def process_element(elem):
                 buffer_word(_pending_word)
 
 
+def compile_badword_fragments(badwords):
+    fragments = [re.escape(badword) for badword in badwords
+                 if len(badword) >= MIN_BADWORD_FRAGMENT_LEN]
+    if not fragments:
+        return None
+    return re.compile('|'.join(fragments))
+
+
 def iter_goodwords():
     global _buffer, _badwords
+    badword_fragments = compile_badword_fragments(_badwords)
     for word in _buffer:
-        ok = True
-        for badword in _badwords:
-            if word is badword:
-                ok = False
-            elif len(badword) >= MIN_BADWORD_FRAGMENT_LEN and badword in word:
-                ok = False
-        if ok:
-            yield word
+        if word in _badwords:
+            continue
+        if badword_fragments and badword_fragments.search(word):
+            continue
+        yield word
 
 
 if __name__ == '__main__':
@@ -175,5 +166,5 @@ if __name__ == '__main__':
     _blacklist = set(read_file(blacklist_file))
     context = lxml.etree.iterparse(wicktionaryxml_file, events=('end',))
     fast_iter_tree(context, process_element)
-    for word in iter_goodwords():
+    for word in sorted(iter_goodwords()):
         sys.stdout.write(word + '\n')
@@ -26,7 +26,7 @@ import os
 import sys
 import argparse
 import re
-from textwrap import wrap
+from listfile import read_file
 try:
     from nltk.corpus import cmudict
 except ImportError:
@@ -60,7 +60,7 @@ LANGUAGES = {
 
 PENALTY_PREFIXES = ('q', 'x', 'z', 'rh', 'ae', 'wr')
 PREFIX_PENALTY_AMOUNT = 1.2
-VOWELS = ('a', 'e', 'i', 'o', 'u', 'y')
+VOWELS = frozenset('aeiouy')
 SUFFIXES = ('', 'acy', 'al', 'ance', 'dom', 'er', 'ism', 'ist', 'ity', 'ment',
             'ness', 'ship', 'sion', 'ate', 'en', 'ify', 'fy', 'ize', 'ise',
             'able', 'ible', 'al', 'esque', 'ful', 'ic', 'ical', 'ious', 'ish',
@@ -88,15 +88,35 @@ _cmudict = cmudict.dict()
 _repititions = re.compile(r'(.+?)\1+')
 
 
+def iter_items(words, params):
+    last = len(words) - 1
+    for i, word in enumerate(words):
+        item = params['wrap_item'] + word + params['wrap_item']
+        if i != last:
+            item += params['separate_item']
+        yield item
+
+
+def pack_lines(items, width):
+    line = []
+    line_len = 0
+    for item in items:
+        if line and line_len + 1 + len(item) > width:
+            yield ' '.join(line)
+            line = []
+            line_len = 0
+        line_len += len(item) + (1 if line else 0)
+        line.append(item)
+    if line:
+        yield ' '.join(line)
+
+
 def number_of_syllables(word):
-    count = 0
-    if len(word) == 0:
+    if not word:
         return 0
-    if word[0] in VOWELS:
-        count += 1
-    for i in range(1, len(word)):
-        if word[i] in VOWELS and word[i - 1] not in VOWELS:
-            count += 1
+    count = word[0] in VOWELS
+    count += sum(1 for (prev, char) in zip(word, word[1:])
+                 if char in VOWELS and prev not in VOWELS)
     if word.endswith('e'):
         count -= 1
     if word.endswith('le'):
@@ -142,12 +162,7 @@ if __name__ == '__main__':
         raise Exception('Invalid language: {}'.format(language))
     if not os.path.isfile(wordlist_file):
         raise Exception('Not a file: {}'.format(wordlist_file))
-    wordlist = set()
-    with open(wordlist_file, 'rt') as wordlist_handle:
-        for word in wordlist_handle:
-            word = word.strip()
-            if word and not word.startswith('#'):
-                    wordlist.add(word)
+    wordlist = set(read_file(wordlist_file))
     words = set()
     for cmuword in _cmudict:
         if cmuword in BAD_WORDS:
@@ -173,7 +188,7 @@ if __name__ == '__main__':
         err = 'Not enough words, supply a larger wordlist. Found: {}, need: {}'
         raise Exception(err.format(len(words), NUM_WORDS))
     words_with_scores = []
-    for word in words:
+    for word in sorted(words):
         score = word_score(word)
         if not score:
             continue
@@ -184,26 +199,22 @@ if __name__ == '__main__':
     for (word, score) in words_truncated:
         words_in_alpha.append(word)
     words_in_alpha = sorted(words_in_alpha)
-    words_format = []
-    for word in words_in_alpha:
-        words_format.append(params['wrap_item'] + word + params['wrap_item'])
     data_start = params['name'] + ' ' + params['equals']
     if params['equals']:
         data_start += ' '
     data_start += params['start_structure']
     spaces = ' ' * len(data_start)
     data_line_len = params['line_length'] - len(data_start)
-    sep = params['separate_item'] + ' '
-    data_body = sep.join([w for w in words_format])
-    data_wrapped = wrap(data_body, width=data_line_len)
+    data_items = iter_items(words_in_alpha, params)
+    data_wrapped = list(pack_lines(data_items, data_line_len))
     first_line = data_wrapped.pop(0)
     last_line = data_wrapped.pop()
-    sys.stdout.write(data_start)
-    sys.stdout.write(first_line + '\n')
-    for line in data_wrapped:
-        sys.stdout.write(spaces + line + '\n')
-    sys.stdout.write(spaces + last_line)
+    output = [data_start + first_line]
+    output.extend(spaces + line for line in data_wrapped)
     if len(last_line) + len(spaces) >= params['line_length']:
-        sys.stdout.write('\n' + spaces + params['end_structure'] + '\n')
+        output.append(spaces + last_line)
+        output.append(spaces + params['end_structure'])
     else:
-        sys.stdout.write(params['end_structure'] + '\n')
+        output.append(spaces + last_line + params['end_structure'])
+    output.append('')
+    sys.stdout.buffer.write('\n'.join(output).encode('utf-8'))